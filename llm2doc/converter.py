@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import itertools
 import json
 import os
-from typing import Any, Callable, Dict, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from docx import Document
-from docx.enum.dml import MSO_COLOR_TYPE, MSO_THEME_COLOR_INDEX
+from docx.document import Document as _Document
+from docx.enum.dml import MSO_THEME_COLOR_INDEX
+from docx.enum.section import WD_ORIENTATION
 from docx.enum.table import WD_CELL_VERTICAL_ALIGNMENT
 from docx.enum.text import (
     WD_ALIGN_PARAGRAPH,
@@ -16,11 +21,17 @@ from docx.enum.text import (
 )
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.oxml import OxmlElement
+from docx.opc.part import Part
 from docx.oxml.ns import qn
 from docx.shared import Pt, RGBColor
 from docx.table import Table, _Cell
+from docx.text.parfmt import ParagraphFormat
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run as _Run
+from lxml import etree
+
+from .json_utils import dumps_indented
+
 # Namespaces used when inspecting low-level XML
 NS = {
     "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
@@ -30,54 +41,137 @@ NS = {
     "wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing",
 }
 
-_id_counter = 0
+# XPath expressions, compiled once at import
+_XP_HLINK_ANCESTOR = etree.XPath("./ancestor::w:hyperlink[1]", namespaces=NS)
+_XP_BLOCKS = etree.XPath("./w:p|./w:tbl", namespaces=NS)
+_XP_RUNS = etree.XPath("./w:r", namespaces=NS)
+_XP_BLIPS = etree.XPath(".//a:blip", namespaces=NS)
+_XP_HAS_BLIP = etree.XPath("boolean(.//a:blip)", namespaces=NS)
+
+# Clark-notation tag/attribute names, resolved once at import
+_QN_W_P = qn("w:p")
+_QN_W_TBL = qn("w:tbl")
+_QN_W_VAL = qn("w:val")
+_QN_W_PPR = qn("w:pPr")
+_QN_W_NUMPR = qn("w:numPr")
+_QN_W_NUMID = qn("w:numId")
+_QN_W_ILVL = qn("w:ilvl")
+_QN_W_RPR = qn("w:rPr")
+_QN_W_VERTALIGN = qn("w:vertAlign")
+_QN_W_RFONTS = qn("w:rFonts")
+_QN_W_ASCII = qn("w:ascii")
+_QN_W_SZ = qn("w:sz")
+_QN_W_COLOR = qn("w:color")
+_QN_W_THEMECOLOR = qn("w:themeColor")
+_QN_W_HIGHLIGHT = qn("w:highlight")
+_QN_W_U = qn("w:u")
+_QN_W_ANCHOR = qn("w:anchor")
+_QN_W_NUM = qn("w:num")
+_QN_W_ABSTRACTNUM = qn("w:abstractNum")
+_QN_W_ABSTRACTNUMID = qn("w:abstractNumId")
+_QN_W_LVL = qn("w:lvl")
+_QN_W_NUMFMT = qn("w:numFmt")
+_QN_W_LVLTEXT = qn("w:lvlText")
+_QN_R_ID = qn("r:id")
+_QN_R_EMBED = qn("r:embed")
+_QN_XML_SPACE = qn("xml:space")
+
+# Run-level on/off properties read straight from w:rPr: (json key, element tag)
+_RUN_TOGGLES = (
+    ("bold", qn("w:b")),
+    ("italic", qn("w:i")),
+)
+_FONT_TOGGLES = (
+    ("all_caps", qn("w:caps")),
+    ("small_caps", qn("w:smallCaps")),
+    ("strike", qn("w:strike")),
+    ("double_strike", qn("w:dstrike")),
+)
+_OFF_VALUES = ("0", "false", "off")
+_RUN_PROP_KEYS = tuple(k for k, _ in _RUN_TOGGLES + _FONT_TOGGLES) + (
+    "superscript", "subscript", "underline", "name", "size_pt", "color", "highlight",
+)
+
+def _xml_names(enum_cls: Any) -> Dict[str, str]:
+    # XML attribute value -> member name; first member wins, like from_xml()
+    names: Dict[str, str] = {}
+    for m in enum_cls:
+        if m.xml_value is not None:
+            names.setdefault(m.xml_value, m.name)
+    return names
+
+# w:u/@w:val -> JSON underline value, mirroring Font.underline (single -> True, none -> False)
+_UNDERLINE_FROM_XML: Dict[str, Union[bool, str]] = {
+    **_xml_names(WD_UNDERLINE), "single": True, "none": False,
+}
+# w:highlight/@w:val -> name; "default" (AUTO) reads as no highlight, as before
+_HIGHLIGHT_FROM_XML = {k: v for k, v in _xml_names(WD_COLOR_INDEX).items() if k != "default"}
+_THEME_COLOR_FROM_XML = _xml_names(MSO_THEME_COLOR_INDEX)
+
+# (numId, ilvl) -> (numFmt, lvlText), built once per document by _build_numbering_map
+# and passed down to the paragraph serializer
+_NumberingMap = Dict[Tuple[str, str], Tuple[Optional[str], Optional[str]]]
 
+# id(part) -> {rId: (url, (filename, content_type))}; reset per document
+_rels_cache: Dict[int, Dict[str, Tuple[Optional[str], Tuple[Optional[str], Optional[str]]]]] = {}
 
-def _get_next_id():
-    global _id_counter
-    _id_counter += 1
-    return f"doc-obj-{_id_counter}"
+# w:color/@w:val -> "#RRGGBB"; reset per document
+_color_cache: Dict[str, Optional[str]] = {}
 
+# id -> serialized object, filled as objects are finished. docx2json creates
+# one per non-streamed call and passes it down; None means nothing is kept.
+_IdIndex = Dict[str, Dict[str, Any]]
 
-def _len_to_pt(x) -> Optional[float]:
+
+class _IndexedDict(Dict[str, Any]):
+    # docx2json result; id_index rides along as an attribute so it is never
+    # serialized (json and orjson both treat this as a plain dict)
+    id_index: _IdIndex
+
+def _get_next_id(ids: Iterator[int]) -> str:
+    # ids is the per-document counter docx2json passes down
+    return f"doc-obj-{next(ids)}"
+
+
+def _indexed(obj: Dict[str, Any], id_index: Optional[_IdIndex]) -> Dict[str, Any]:
+    if id_index is not None:
+        id_index[obj["id"]] = obj
+    return obj
+
+def _len_to_pt(x: Any) -> Optional[float]:
     if x is None:
         return None
-    try:
-        return float(x.pt)
-    except Exception:
-        try:
-            # Sometimes values are stored as Emu or Twips lengths in python-docx,
-            # but Length exposes .pt. If not, try direct cast.
-            return float(x)
-        except Exception:
-            return None
-
-def _color_to_hex(color) -> Optional[str]:
-    if color is None or not hasattr(color, "type") or color.type is None:
+    pt = getattr(x, "pt", None)
+    if pt is not None:
+        return float(pt)
+    # Sometimes values are stored as Emu or Twips lengths in python-docx,
+    # but Length exposes .pt. If not, take a plain number as-is.
+    return float(x) if isinstance(x, (int, float)) else None
+
+def _color_to_hex(color: Any) -> Optional[str]:
+    # color is a w:color element; same results as python-docx's ColorFormat
+    if color is None:
+        return None
+    theme = color.get(_QN_W_THEMECOLOR)
+    if theme is not None:
+        return _THEME_COLOR_FROM_XML.get(theme)
+    val = color.get(_QN_W_VAL)
+    if val == "auto":
+        return "#000000"
+    if val is None:
         return None
     try:
-        if color.type == MSO_COLOR_TYPE.RGB:
-            if color.rgb is not None:
-                return f"#{color.rgb}"
-        elif color.type == MSO_COLOR_TYPE.THEME:
-            return color.theme_color.name
-        elif color.type == MSO_COLOR_TYPE.AUTO:
-            return "#000000"
-    except Exception:
+        return _color_cache[val]
+    except KeyError:
         pass
-    return None
-
-def _underline_value(u) -> Optional[Union[bool, str]]:
-    # python-docx run.underline may be True/False/None or a WD_UNDERLINE enum.
-    if u is None or isinstance(u, bool):
-        return u
     try:
-        # Enum value -> its name (e.g., 'SINGLE', 'DOUBLE', ...)
-        return u.name if hasattr(u, "name") else str(u)
+        hex_str = "#%02X%02X%02X" % RGBColor.from_string(val)
     except Exception:
-        return str(u)
+        hex_str = None
+    _color_cache[val] = hex_str
+    return hex_str
 
-def _line_spacing_info(pf) -> Dict[str, Optional[Union[float, str]]]:
+def _line_spacing_info(pf: ParagraphFormat) -> Dict[str, Optional[Union[float, str]]]:
     # line_spacing can be a multiple (float) or an absolute length
     ls_mult = None
     ls_pt = None
@@ -90,7 +184,9 @@ def _line_spacing_info(pf) -> Dict[str, Optional[Union[float, str]]]:
     except Exception:
         pass
     try:
-        rule = pf.line_spacing_rule.name if pf.line_spacing_rule else None
+        # parses w:spacing/@w:lineRule; malformed values raise here
+        rule_enum = pf.line_spacing_rule
+        rule = rule_enum.name if rule_enum else None
     except Exception:
         rule = None
     return {
@@ -99,148 +195,232 @@ def _line_spacing_info(pf) -> Dict[str, Optional[Union[float, str]]]:
         "line_spacing_rule": rule,
     }
 
-def _get_paragraph_numbering_info(doc: Document, p: Paragraph) -> Optional[Dict[str, Any]]:
+def _child_val(elm: Any, tag: str) -> Optional[str]:
+    # w:val of the first child with this tag, or None
+    child = elm.find(tag)
+    return child.get(_QN_W_VAL) if child is not None else None
+
+def _build_numbering_map(doc: _Document) -> Optional[_NumberingMap]:
+    # One pass over numbering.xml instead of two XPath queries per list paragraph;
+    # None when the document has no numbering part
+    try:
+        ne = doc.part.numbering_part.element  # CT_Numbering element
+    except NotImplementedError:
+        # python-docx cannot create the missing part on read
+        return None
+    levels: Dict[str, List[Tuple[str, Tuple[Optional[str], Optional[str]]]]] = {}
+    for abstract in ne.iterchildren(_QN_W_ABSTRACTNUM):
+        abs_id = abstract.get(_QN_W_ABSTRACTNUMID)
+        if abs_id is None:
+            continue
+        abs_levels = levels.setdefault(abs_id, [])
+        for lvl in abstract.iterchildren(_QN_W_LVL):
+            ilvl = lvl.get(_QN_W_ILVL)
+            if ilvl is not None:
+                abs_levels.append((ilvl, (_child_val(lvl, _QN_W_NUMFMT), _child_val(lvl, _QN_W_LVLTEXT))))
+    num_to_abs: Dict[str, Optional[str]] = {}
+    for num in ne.iterchildren(_QN_W_NUM):
+        num_id = num.get(_QN_W_NUMID)
+        if num_id is not None and num.find(_QN_W_ABSTRACTNUMID) is not None:
+            num_to_abs.setdefault(num_id, _child_val(num, _QN_W_ABSTRACTNUMID))
+    numbering: _NumberingMap = {}
+    for num_id, abs_id in num_to_abs.items():
+        # first definition wins on duplicates
+        for ilvl, info in levels.get(abs_id or "", ()):
+            numbering.setdefault((num_id, ilvl), info)
+    return numbering
+
+def _get_paragraph_numbering_info(p: Paragraph, numbering_map: Optional[_NumberingMap]) -> Optional[Dict[str, Any]]:
     # Detect Word numbering (bullets/numbered lists)
+    if numbering_map is None:
+        return None
     try:
-        pPr = p._p.pPr
-        if pPr is None or pPr.numPr is None:
+        pPr = p._p.find(_QN_W_PPR)
+        numPr = pPr.find(_QN_W_NUMPR) if pPr is not None else None
+        if numPr is None:
             return None
-        num_id = None
+        num_id: Optional[int] = None
         ilvl = 0
-        if pPr.numPr.numId is not None and pPr.numPr.numId.val is not None:
-            num_id = int(pPr.numPr.numId.val)
-        if pPr.numPr.ilvl is not None and pPr.numPr.ilvl.val is not None:
-            ilvl = int(pPr.numPr.ilvl.val)
-        result = {"numId": num_id, "level": ilvl, "format": None, "lvlText": None}
-
-        # Try to resolve bullet/number format from numbering part
-        numbering_part = getattr(doc.part, "numbering_part", None)
-        if numbering_part is None or num_id is None:
-            return result
-
-        ne = numbering_part.element  # CT_Numbering element
-        ns = dict(ne.nsmap)
-        ns.update(NS)
-
-        abs_nodes = ne.xpath(f'.//w:num[@w:numId="{num_id}"]/w:abstractNumId', namespaces=ns)
-        if not abs_nodes:
-            return result
-        abs_id = abs_nodes[0].get(qn("w:val"))
-
-        lvl_nodes = ne.xpath(
-            f'.//w:abstractNum[@w:abstractNumId="{abs_id}"]/w:lvl[@w:ilvl="{ilvl}"]',
-            namespaces=ns,
-        )
-        if not lvl_nodes:
-            return result
-
-        fmt_node = lvl_nodes[0].find(qn("w:numFmt"))
-        txt_node = lvl_nodes[0].find(qn("w:lvlText"))
-        if fmt_node is not None:
-            result["format"] = fmt_node.get(qn("w:val"))
-        if txt_node is not None:
-            result["lvlText"] = txt_node.get(qn("w:val"))
-        return result
-    except Exception:
+        num_id_val = _child_val(numPr, _QN_W_NUMID)
+        if num_id_val is not None:
+            num_id = int(num_id_val)
+        ilvl_val = _child_val(numPr, _QN_W_ILVL)
+        if ilvl_val is not None:
+            ilvl = int(ilvl_val)
+    except ValueError:
         return None
+    result: Dict[str, Any] = {"numId": num_id, "level": ilvl, "format": None, "lvlText": None}
+    if num_id is not None:
+        result["format"], result["lvlText"] = numbering_map.get((str(num_id), str(ilvl)), (None, None))
+    return result
 
-def _get_hyperlink_info(run) -> Optional[Dict[str, Any]]:
-    try:
-        r = run._r
-        parent = r.getparent()
-        # climb up until hyperlink or root
-        while parent is not None and parent.tag != qn("w:hyperlink"):
-            parent = parent.getparent()
-        if parent is None:
-            return None
-        rId = parent.get(qn("r:id"))
-        anchor = parent.get(qn("w:anchor"))
-        url = None
-        if rId and rId in run.part.rels:
-            rel = run.part.rels[rId]
+def _resolve_rels(part: Part) -> Dict[str, Tuple[Optional[str], Tuple[Optional[str], Optional[str]]]]:
+    # Resolve every relationship of a part once; runs then only do dict lookups.
+    key = id(part)
+    resolved = _rels_cache.get(key)
+    if resolved is not None:
+        return resolved
+    resolved = {}
+    for rId, rel in part.rels.items():
+        try:
+            url = str(rel.target_ref)
+        except Exception:
             try:
-                # External link
-                url = str(rel.target_ref)
+                url = str(rel._target)  # fallback
             except Exception:
-                try:
-                    url = str(rel._target)  # fallback
-                except Exception:
-                    url = None
-        return {"rId": rId, "url": url, "anchor": anchor}
-    except Exception:
-        return None
-
-def _get_run_images(run) -> List[Dict[str, Any]]:
-    # Detect images embedded in this run (inline shapes)
-    images = []
-    try:
-        # Look for DrawingML blips
-        blips = run._r.xpath(".//a:blip", namespaces=NS)
-        for blip in blips:
-            rId = blip.get(qn("r:embed"))
-            if not rId:
-                continue
-            rel = run.part.rels.get(rId)
-            if rel is None:
-                continue
-            # For images, target_part has .image with filename, content_type
-            part = getattr(rel, "target_part", None)
-            if part is None:
-                # some versions expose _target_part
-                part = getattr(rel, "_target_part", None)
-            info = {"rId": rId, "filename": None, "content_type": None}
+                url = None
+        filename = content_type = None
+        if not rel.is_external:
             try:
-                img = getattr(part, "image", None)
+                # For images, target_part has .image with filename, content_type
+                target = getattr(rel, "target_part", None)
+                if target is None:
+                    # some versions expose _target_part
+                    target = getattr(rel, "_target_part", None)
+                img = getattr(target, "image", None)
                 if img is not None:
-                    info["filename"] = img.filename
-                    info["content_type"] = getattr(part, "content_type", None)
+                    filename = img.filename
                 else:
                     # fallback info
-                    info["filename"] = getattr(part, "partname", None)
-                    info["content_type"] = getattr(part, "content_type", None)
+                    filename = getattr(target, "partname", None)
+                content_type = getattr(target, "content_type", None)
             except Exception:
                 pass
-            images.append(info)
-    except Exception:
-        pass
+        resolved[rId] = (url, (filename, content_type))
+    _rels_cache[key] = resolved
+    return resolved
+
+def _get_hyperlink_info(run: _Run) -> Optional[Dict[str, Any]]:
+    # nearest enclosing hyperlink, resolved by libxml2 in one call
+    res = _XP_HLINK_ANCESTOR(run._r)
+    if not res:
+        return None
+    parent = res[0]
+    rId = parent.get(_QN_R_ID)
+    anchor = parent.get(_QN_W_ANCHOR)
+    url = None
+    if rId:
+        entry = _resolve_rels(run.part).get(rId)
+        if entry is not None:
+            url = entry[0]
+    return {"rId": rId, "url": url, "anchor": anchor}
+
+def _get_run_images(run: _Run) -> List[Dict[str, Any]]:
+    # Detect images embedded in this run (inline shapes)
+    images: List[Dict[str, Any]] = []
+    # Look for DrawingML blips
+    blips = _XP_BLIPS(run._r)
+    if not blips:
+        return images
+    rels = _resolve_rels(run.part)
+    for blip in blips:
+        rId = blip.get(_QN_R_EMBED)
+        entry = rels.get(rId) if rId else None
+        if entry is None:
+            continue
+        filename, content_type = entry[1]
+        images.append({"rId": rId, "filename": filename, "content_type": content_type})
     return images
 
-def _serialize_run(run) -> Dict[str, Any]:
-    font = run.font
-    highlight = None
-    try:
-        highlight = font.highlight_color.name if font.highlight_color else None
-    except Exception:
-        highlight = None
+def _style_name(obj: Any) -> Optional[str]:
+    style = getattr(obj, "style", None)
+    return style.name if style is not None else None
+
+def _drop_empty(d: Dict[str, Any]) -> Dict[str, Any]:
+    # Compact form of a freshly built dict: drop None, "" and [] values.
+    # Nested dicts such as font/paragraph_format stay even when emptied.
+    return {k: v for k, v in d.items() if v is not None and v != "" and v != []}
+
+def _on_off(rpr: Any, tag: str) -> Optional[bool]:
+    # ST_OnOff: element absent -> None, bare element or true/on/1 -> True
+    el = rpr.find(tag)
+    if el is None:
+        return None
+    return el.get(_QN_W_VAL) not in _OFF_VALUES
+
+def _read_run_props(run: _Run, rpr: Any) -> Dict[str, Any]:
+    """Formatting of one run, read from its w:rPr with a handful of find() calls."""
+    props: Dict[str, Any] = dict.fromkeys(_RUN_PROP_KEYS)
+    if rpr is None:
+        return props
+    for key, tag in _RUN_TOGGLES:
+        props[key] = _on_off(rpr, tag)
+    for key, tag in _FONT_TOGGLES:
+        props[key] = _on_off(rpr, tag)
+    va = rpr.find(_QN_W_VERTALIGN)
+    if va is not None:
+        va_val = va.get(_QN_W_VAL)
+        props["superscript"] = va_val == "superscript"
+        props["subscript"] = va_val == "subscript"
+
+    u = rpr.find(_QN_W_U)
+    if u is not None:
+        u_val = u.get(_QN_W_VAL)
+        props["underline"] = _UNDERLINE_FROM_XML.get(u_val) if u_val is not None else None
+    fonts = rpr.find(_QN_W_RFONTS)
+    if fonts is not None:
+        props["name"] = fonts.get(_QN_W_ASCII)
+    sz = rpr.find(_QN_W_SZ)
+    if sz is not None:
+        sz_val = sz.get(_QN_W_VAL) or ""
+        # half-points; anything else (e.g. "12pt") goes through python-docx
+        props["size_pt"] = int(sz_val) / 2.0 if sz_val.isdigit() else _len_to_pt(run.font.size)
+    props["color"] = _color_to_hex(rpr.find(_QN_W_COLOR))
+    hl = rpr.find(_QN_W_HIGHLIGHT)
+    if hl is not None:
+        props["highlight"] = _HIGHLIGHT_FROM_XML.get(hl.get(_QN_W_VAL))
+    return props
+
+def _serialize_run(run: _Run, ids: Iterator[int], rpr: Any = None, compact: bool = False,
+                   has_images: bool = True) -> Dict[str, Any]:
+    props = _read_run_props(run, rpr)
+    font_obj: Dict[str, Any] = {
+        "name": props["name"],
+        "size_pt": props["size_pt"],
+        "color": props["color"],
+        "highlight": props["highlight"],
+        "all_caps": props["all_caps"],
+        "small_caps": props["small_caps"],
+        "strike": props["strike"],
+        "double_strike": props["double_strike"],
+        "superscript": props["superscript"],
+        "subscript": props["subscript"],
+    }
+    hyperlink = _get_hyperlink_info(run)
+    images = _get_run_images(run) if has_images else []
+    if compact:
+        font_obj = _drop_empty(font_obj)
+        if hyperlink:
+            hyperlink = _drop_empty(hyperlink)
+        images = [_drop_empty(i) for i in images]
 
     run_obj: Dict[str, Any] = {
-        "id": _get_next_id(),
+        "id": _get_next_id(ids),
         "type": "run",
         "text": run.text,
-        "style": run.style.name if getattr(run, "style", None) else None,
-        "bold": bool(run.bold) if run.bold is not None else None,
-        "italic": bool(run.italic) if run.italic is not None else None,
-        "underline": _underline_value(run.underline),
-        "font": {
-            "name": font.name,
-            "size_pt": _len_to_pt(font.size),
-            "color": _color_to_hex(font.color),
-            "highlight": highlight,
-            "all_caps": bool(font.all_caps) if font.all_caps is not None else None,
-            "small_caps": bool(font.small_caps) if font.small_caps is not None else None,
-            "strike": bool(font.strike) if font.strike is not None else None,
-            "double_strike": bool(font.double_strike) if font.double_strike is not None else None,
-            "superscript": bool(font.superscript) if font.superscript is not None else None,
-            "subscript": bool(font.subscript) if font.subscript is not None else None,
-        },
-        "hyperlink": _get_hyperlink_info(run),
-        "images": _get_run_images(run) or None,
+        "style": _style_name(run),
+        "bold": props["bold"],
+        "italic": props["italic"],
+        "underline": props["underline"],
+        "font": font_obj,
+        "hyperlink": hyperlink,
+        "images": images or None,
     }
+    if compact:
+        run_obj = _drop_empty(run_obj)
 
     # If run contains only images and no text, keep text as empty string; that's fine.
     return run_obj
 
-def _serialize_paragraph(doc: Document, p: Paragraph, compact: bool = False) -> Dict[str, Any]:
+def _fast_serialize_runs(p: Paragraph, ids: Iterator[int], compact: bool = False) -> List[Dict[str, Any]]:
+    # One XPath for the paragraph's runs; each run's w:rPr is fetched once and
+    # read directly instead of through python-docx's Font descriptors.
+    # Image lookup per run is skipped when the paragraph holds no blip at all.
+    has_images = _XP_HAS_BLIP(p._p)
+    return [_serialize_run(_Run(r, p), ids, r.find(_QN_W_RPR), compact, has_images) for r in _XP_RUNS(p._p)]
+
+def _serialize_paragraph(p: Paragraph, numbering_map: Optional[_NumberingMap],
+                         ids: Iterator[int], id_index: Optional[_IdIndex], compact: bool = False) -> Dict[str, Any]:
     pf = p.paragraph_format
     align = None
     try:
@@ -248,31 +428,41 @@ def _serialize_paragraph(doc: Document, p: Paragraph, compact: bool = False) ->
     except Exception:
         align = None
 
-    runs_data = [_serialize_run(r) for r in p.runs]
+    runs_data = _fast_serialize_runs(p, ids, compact)
     if compact:
         runs_data = _merge_runs(runs_data)
+    for run_obj in runs_data:
+        _indexed(run_obj, id_index)
+
+    numbering = _get_paragraph_numbering_info(p, numbering_map)
+    fmt_obj: Dict[str, Any] = {
+        "left_indent_pt": _len_to_pt(getattr(pf, "left_indent", None)),
+        "right_indent_pt": _len_to_pt(getattr(pf, "right_indent", None)),
+        "first_line_indent_pt": _len_to_pt(getattr(pf, "first_line_indent", None)),
+        "space_before_pt": _len_to_pt(getattr(pf, "space_before", None)),
+        "space_after_pt": _len_to_pt(getattr(pf, "space_after", None)),
+        **_line_spacing_info(pf),
+    }
+    if compact:
+        fmt_obj = _drop_empty(fmt_obj)
+        if numbering:
+            numbering = _drop_empty(numbering)
 
     para_obj: Dict[str, Any] = {
-        "id": _get_next_id(),
+        "id": _get_next_id(ids),
         "type": "paragraph",
-        "style": p.style.name if getattr(p, "style", None) else None,
+        "style": _style_name(p),
         "alignment": align,
-        "numbering": _get_paragraph_numbering_info(doc, p),
-        "paragraph_format": {
-            "left_indent_pt": _len_to_pt(getattr(pf, "left_indent", None)),
-            "right_indent_pt": _len_to_pt(getattr(pf, "right_indent", None)),
-            "first_line_indent_pt": _len_to_pt(getattr(pf, "first_line_indent", None)),
-            "space_before_pt": _len_to_pt(getattr(pf, "space_before", None)),
-            "space_after_pt": _len_to_pt(getattr(pf, "space_after", None)),
-            **_line_spacing_info(pf),
-        },
+        "numbering": numbering,
+        "paragraph_format": fmt_obj,
         "runs": runs_data,
     }
-    return para_obj
+    if compact:
+        para_obj = _drop_empty(para_obj)
+    return _indexed(para_obj, id_index)
 
-def _iter_block_items(parent) -> Any:
+def _iter_block_items(parent: Union[_Document, _Cell]) -> Iterator[Union[Paragraph, Table]]:
     # Preserve document order of paragraphs and tables
-    from docx.document import Document as _Document
     if isinstance(parent, _Document):
         parent_elm = parent.element.body
     elif isinstance(parent, _Cell):
@@ -280,47 +470,52 @@ def _iter_block_items(parent) -> Any:
     else:
         raise TypeError("Unsupported parent for block iteration")
 
-    for child in parent_elm.iterchildren():
-        if child.tag == qn("w:p"):
+    # lxml filters on the tags in C and yields w:p / w:tbl in document order.
+    for child in parent_elm.iterchildren(_QN_W_P, _QN_W_TBL):
+        if child.tag == _QN_W_P:
             yield Paragraph(child, parent)
-        elif child.tag == qn("w:tbl"):
+        else:
             yield Table(child, parent)
 
-def _serialize_cell(cell: _Cell, doc: Document, compact: bool = False) -> Dict[str, Any]:
+def _serialize_cell(cell: _Cell, numbering_map: Optional[_NumberingMap],
+                    ids: Iterator[int], id_index: Optional[_IdIndex], compact: bool = False) -> Dict[str, Any]:
     # Collect the blocks within a cell (paragraphs and nested tables)
     blocks: List[Dict[str, Any]] = []
     for item in _iter_block_items(cell):
         if isinstance(item, Paragraph):
-            blocks.append(_serialize_paragraph(doc, item, compact=compact))
+            blocks.append(_serialize_paragraph(item, numbering_map, ids, id_index, compact=compact))
         elif isinstance(item, Table):
-            blocks.append(_serialize_table(doc, item, compact=compact))
+            blocks.append(_serialize_table(item, numbering_map, ids, id_index, compact=compact))
     v_align = None
     try:
         v_align = cell.vertical_alignment.name if cell.vertical_alignment else None
     except Exception:
         v_align = None
-    return {
-        "id": _get_next_id(),
+    cell_obj: Dict[str, Any] = {
+        "id": _get_next_id(ids),
         "type": "cell",
         "vertical_alignment": v_align,
         "blocks": blocks,
     }
+    return _indexed(_drop_empty(cell_obj) if compact else cell_obj, id_index)
 
-def _serialize_table(doc: Document, tbl: Table, compact: bool = False) -> Dict[str, Any]:
+def _serialize_table(tbl: Table, numbering_map: Optional[_NumberingMap],
+                     ids: Iterator[int], id_index: Optional[_IdIndex], compact: bool = False) -> Dict[str, Any]:
     table_obj: Dict[str, Any] = {
-        "id": _get_next_id(),
+        "id": _get_next_id(ids),
         "type": "table",
-        "style": tbl.style.name if getattr(tbl, "style", None) else None,
+        "style": _style_name(tbl),
         "rows": [],
     }
     for row in tbl.rows:
-        row_cells = [_serialize_cell(cell, doc, compact=compact) for cell in row.cells]
-        table_obj["rows"].append(row_cells)
-    return table_obj
+        row_cells = [_serialize_cell(cell, numbering_map, ids, id_index, compact=compact) for cell in row.cells]
+        if row_cells or not compact:
+            table_obj["rows"].append(row_cells)
+    return _indexed(_drop_empty(table_obj) if compact else table_obj, id_index)
 
-def _core_properties(doc: Document) -> Dict[str, Any]:
+def _core_properties(doc: _Document) -> Dict[str, Any]:
     cp = doc.core_properties
-    def ts(x):
+    def ts(x: Any) -> Optional[str]:
         if not x:
             return None
         if isinstance(x, datetime.datetime):
@@ -339,7 +534,7 @@ def _core_properties(doc: Document) -> Dict[str, Any]:
         "version": cp.version,
     }
 
-def _section_info(doc: Document) -> List[Dict[str, Any]]:
+def _section_info(doc: _Document) -> List[Dict[str, Any]]:
     infos = []
     for s in doc.sections:
         try:
@@ -358,11 +553,124 @@ def _section_info(doc: Document) -> List[Dict[str, Any]]:
             infos.append({})
     return infos
 
+def _json_dumps(obj: Any, indent: Optional[int]) -> str:
+    # orjson only indents by 2; json_utils uses it when installed.
+    if indent == 2:
+        return dumps_indented(obj)
+    return json.dumps(obj, ensure_ascii=False, indent=indent)
+
+def _iter_serialized_blocks(doc: _Document, ids: Iterator[int], id_index: Optional[_IdIndex],
+                            compact: bool = False) -> Iterator[Dict[str, Any]]:
+    numbering_map = _build_numbering_map(doc)
+    for item in _iter_block_items(doc):
+        if isinstance(item, Paragraph):
+            yield _serialize_paragraph(item, numbering_map, ids, id_index, compact=compact)
+        elif isinstance(item, Table):
+            yield _serialize_table(item, numbering_map, ids, id_index, compact=compact)
+
+# Document and its numbering map, set up once per worker process by _init_block_worker
+_worker_doc: Optional[_Document] = None
+_worker_numbering_map: Optional[_NumberingMap] = None
+
+def _init_block_worker(docx_path: str) -> None:
+    global _worker_doc, _worker_numbering_map
+    _rels_cache.clear()
+    _worker_doc = Document(docx_path)
+    _worker_numbering_map = _build_numbering_map(_worker_doc)
+
+def _serialize_block_range(bounds: Tuple[int, int], compact: bool) -> Tuple[List[Dict[str, Any]], int]:
+    """Serialize top-level blocks [start, stop) in a worker; ids restart at 1."""
+    ids = itertools.count(1)
+    doc = _worker_doc
+    if doc is None:
+        raise RuntimeError("block worker used without _init_block_worker")
+    numbering_map = _worker_numbering_map
+    start, stop = bounds
+    out: List[Dict[str, Any]] = []
+    for elm in _XP_BLOCKS(doc.element.body)[start:stop]:
+        if elm.tag == _QN_W_P:
+            # No index here; the parent indexes the returned blocks
+            out.append(_serialize_paragraph(Paragraph(elm, doc), numbering_map, ids, None, compact=compact))
+        else:
+            out.append(_serialize_table(Table(elm, doc), numbering_map, ids, None, compact=compact))
+    return out, next(ids) - 1
+
+def _shift_ids(blocks: List[Dict[str, Any]], offset: int, index: Optional[_IdIndex]) -> None:
+    # Renumbers a worker chunk and indexes it in the same walk
+    stack: List[Any] = list(blocks)
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            oid = obj.get("id")
+            if isinstance(oid, str) and oid.startswith("doc-obj-"):
+                if offset:
+                    obj["id"] = oid = f"doc-obj-{int(oid[8:]) + offset}"
+                if index is not None:
+                    index[oid] = obj
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+
+def _iter_serialized_blocks_parallel(docx_path: str, n_blocks: int, compact: bool, workers: int,
+                                     id_index: Optional[_IdIndex]) -> Iterator[Dict[str, Any]]:
+    # Chunks are serialized out of process; renumbering each chunk by the ids
+    # used before it reproduces exactly the ids of a serial run.
+    chunk = max(1, n_blocks // (4 * workers))
+    ranges = [(i, min(i + chunk, n_blocks)) for i in range(0, n_blocks, chunk)]
+    offset = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_block_worker,
+                             initargs=(docx_path,)) as ex:
+        for blocks, used in ex.map(_serialize_block_range, ranges, itertools.repeat(compact)):
+            _shift_ids(blocks, offset, id_index)
+            yield from blocks
+            offset += used
+
+def _dump_streaming(f: IO[str], head: Dict[str, Any], blocks: Iterable[Dict[str, Any]],
+                    indent: Optional[int], compact: bool = False) -> None:
+    """
+    Write head plus a trailing "blocks" list to f, one block at a time.
+    The text matches json.dump(); only a single block is held in memory.
+    """
+    it = iter(blocks)
+    first = next(it, None)
+    if first is None and compact:
+        # compact output omits an empty blocks list
+        f.write(_json_dumps(head, indent))
+        return
+
+    text = _json_dumps({**head, "blocks": []}, indent)
+    tail = "[]\n}" if indent is not None else "[]}"
+    f.write(text[:-len(tail)])
+    if first is None:
+        f.write(tail)
+        return
+
+    if indent is None:
+        item_sep, open_, close = ", ", "[", "]}"
+        pad = ""
+    else:
+        outer = " " * indent
+        pad = outer * 2  # items sit two levels deep
+        item_sep, open_, close = ",\n" + pad, "[\n" + pad, "\n" + outer + "]\n}"
+
+    f.write(open_)
+    sep = ""
+    for block in itertools.chain((first,), it):
+        chunk = _json_dumps(block, indent)
+        if pad:
+            chunk = chunk.replace("\n", "\n" + pad)
+        f.write(sep)
+        f.write(chunk)
+        sep = item_sep
+    f.write(close)
+
 def docx2json(
     docx_path: str,
     json_path: Optional[str] = None,
     indent: int = 2,
     compact: bool = False,
+    stream: bool = False,
+    workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Convert a .docx file into a JSON-serializable Python dict describing the document
@@ -373,42 +681,86 @@ def docx2json(
         json_path: Optional path to write a JSON file. If None, no file is written.
         indent: JSON indentation when writing to file.
         compact: If True, remove null values and merge runs to reduce size.
+        stream: If True and json_path is given, blocks are written to the file
+                one at a time as they are serialized instead of being collected
+                first; the returned dict then has an empty "blocks" list.
+        workers: If greater than 1, top-level blocks are serialized in that many
+                 worker processes (each reopens docx_path). Output, including
+                 ids, is the same as a serial run. Worth it for large documents.
 
     Returns:
         A dict with:
         - meta: basic info and core properties
         - sections: page layout info
         - blocks: ordered list of top-level blocks (paragraph or table)
+        Unless streaming, the dict also carries an ``id_index`` attribute mapping
+        every object id to its dict; it is not part of the JSON output.
     """
-    global _id_counter
-    _id_counter = 0
+    stream_path = json_path if stream else None
+    ids = itertools.count(1)
+    # Streaming keeps one block at a time, so it builds no index.
+    id_index: Optional[_IdIndex] = None if stream_path else {}
+    _rels_cache.clear()
+    _color_cache.clear()
     doc = Document(docx_path)
 
-    blocks: List[Dict[str, Any]] = []
-    for item in _iter_block_items(doc):
-        if isinstance(item, Paragraph):
-            blocks.append(_serialize_paragraph(doc, item, compact=compact))
-        elif isinstance(item, Table):
-            blocks.append(_serialize_table(doc, item, compact=compact))
+    # Lazy: nothing is serialized until the iterator is consumed below.
+    if workers and workers > 1 and isinstance(docx_path, (str, os.PathLike)):
+        n_blocks = len(_XP_BLOCKS(doc.element.body))
+        block_iter = _iter_serialized_blocks_parallel(docx_path, n_blocks, compact, workers, id_index)
+    else:
+        block_iter = _iter_serialized_blocks(doc, ids, id_index, compact)
+
+    blocks: List[Dict[str, Any]] = [] if stream_path else list(block_iter)
 
+    core_props = _core_properties(doc)
+    sections = _section_info(doc)
+    if compact:
+        core_props = _drop_empty(core_props)
+        sections = [_drop_empty(s) for s in sections if s]
+
+    meta: Dict[str, Any] = {
+        "source": docx_path,
+        "generated_at": datetime.datetime.utcnow().isoformat() + "Z",
+        "core_properties": core_props,
+    }
     result: Dict[str, Any] = {
         "version": "1.0",
-        "meta": {
-            "source": docx_path,
-            "generated_at": datetime.datetime.utcnow().isoformat() + "Z",
-            "core_properties": _core_properties(doc),
-        },
-        "sections": _section_info(doc),
+        "meta": _drop_empty(meta) if compact else meta,
+        "sections": sections,
         "blocks": blocks,
     }
+
+    if stream_path:
+        head = {k: v for k, v in result.items() if k != "blocks"}
+        if compact:
+            head = _drop_empty(head)
+        with open(stream_path, "w", encoding="utf-8") as f:
+            _dump_streaming(f, head, block_iter, indent, compact)
+        return result
+
+    # Compact output is emitted directly while building, so no cleaning pass.
     if compact:
-        result = _clean_dict(result)
+        result = _drop_empty(result)
 
     if json_path:
         with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, ensure_ascii=False, indent=indent)
+            f.write(_json_dumps(result, indent))
 
-    return result
+    indexed = _IndexedDict(result)
+    indexed.id_index = id_index or {}
+    return indexed
+
+def compact_json(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a compact copy of docx2json output, e.g. for an LLM prompt.
+
+    Unlike docx2json(compact=True), runs are not merged, so every id still refers
+    to the same object as in data and modifications made against the copy can be
+    applied to data with apply_modifications. None, empty strings and empty
+    lists/dicts are dropped at every depth.
+    """
+    return _clean_dict(data)
 
 # Example usage:
 # data = docx2json("input.docx", "output.json")
@@ -417,13 +769,51 @@ def docx2json(
 
 
 
+def _is_empty(v: Any) -> bool:
+    # None, "", [] or {}; 0 and False are kept
+    return v is None or (isinstance(v, (str, list, dict)) and not v)
+
 def _clean_dict(d: Any) -> Any:
-    """Recursively remove None values, empty strings, and empty lists/dicts."""
-    if isinstance(d, dict):
-        return {k: _clean_dict(v) for k, v in d.items() if v is not None and v != "" and v != [] and v != {}}
-    if isinstance(d, list):
-        return [_clean_dict(i) for i in d if i is not None and i != "" and i != [] and i != {}]
-    return d
+    """Remove None values, empty strings, and empty lists/dicts at every depth."""
+    if not isinstance(d, (dict, list)):
+        return d
+    # The cleaned copy is built top-down with an explicit stack instead of
+    # recursion; each nested container is recorded with its slot in the parent.
+    root: Any = {} if isinstance(d, dict) else []
+    stack = [(d, root)]
+    nested: List[Tuple[Any, Any, Any]] = []  # (parent copy, key or index, copy)
+    while stack:
+        src, dst = stack.pop()
+        if isinstance(src, dict):
+            for k, v in src.items():
+                if _is_empty(v):
+                    continue
+                if isinstance(v, (dict, list)):
+                    child: Any = {} if isinstance(v, dict) else []
+                    stack.append((v, child))
+                    nested.append((dst, k, child))
+                    v = child
+                dst[k] = v
+        else:
+            for v in src:
+                if _is_empty(v):
+                    continue
+                if isinstance(v, (dict, list)):
+                    child = {} if isinstance(v, dict) else []
+                    stack.append((v, child))
+                    nested.append((dst, len(dst), child))
+                    v = child
+                dst.append(v)
+    # Containers can end up empty only once their own children are cleaned.
+    # Children are recorded after their parents and list slots in ascending
+    # order, so a reverse pass is post-order and list indexes stay valid.
+    for parent, slot, child in reversed(nested):
+        if not child:
+            del parent[slot]
+    return root
+
+# Run keys that carry styling; ids and text are deliberately not compared.
+_STYLE_KEYS = ("style", "bold", "italic", "underline", "font", "hyperlink", "images")
 
 def _merge_runs(runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Merge consecutive runs with identical styling."""
@@ -442,14 +832,16 @@ def _merge_runs(runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return merged
 
 def _are_styles_equal(run1: Dict[str, Any], run2: Dict[str, Any]) -> bool:
-    """Check if two run objects have the same styling properties after cleaning."""
-    style1 = {k: v for k, v in run1.items() if k != "text"}
-    style2 = {k: v for k, v in run2.items() if k != "text"}
-    return _clean_dict(style1) == _clean_dict(style2)
+    """Check if two (compact) run objects have the same styling properties."""
+    for k in _STYLE_KEYS:
+        if run1.get(k) != run2.get(k):
+            return False
+    return True
 
 def _pt(x: Optional[float]):
     return Pt(float(x)) if isinstance(x, (int, float)) else None
 
+@functools.lru_cache(maxsize=256)
 def _rgb_from_hex(s: Optional[str]) -> Optional[RGBColor]:
     if not s:
         return None
@@ -459,26 +851,34 @@ def _rgb_from_hex(s: Optional[str]) -> Optional[RGBColor]:
     if len(s) != 6:
         return None
     try:
-        r = int(s[0:2], 16)
-        g = int(s[2:4], 16)
-        b = int(s[4:6], 16)
+        # one C-level parse; unlike int(s, 16) it rejects "0x"/sign/"_" forms
+        r, g, b = bytes.fromhex(s)
         return RGBColor(r, g, b)
     except Exception:
         return None
 
-def _get_enum(enum_cls, name: Optional[str]):
-    if not name:
-        return None
+@functools.lru_cache(maxsize=None)
+def _enum_members_upper(enum_cls) -> Dict[str, Any]:
+    return {k.upper(): v for k, v in enum_cls.__members__.items()}  # type: ignore
+
+# Bounded: names come from LLM-written JSON; the real enum names always fit
+@functools.lru_cache(maxsize=1024)
+def _resolve_enum(enum_cls, upper_name: str):
     try:
-        return getattr(enum_cls, str(name).upper())
+        return getattr(enum_cls, upper_name)
     except Exception:
         # sometimes name is already an enum, or mixed case; try case-insensitive
         try:
-            vals = {k.upper(): v for k, v in enum_cls.__members__.items()}  # type: ignore
-            return vals.get(str(name).upper())
+            return _enum_members_upper(enum_cls).get(upper_name)
         except Exception:
             return None
 
+def _get_enum(enum_cls, name: Optional[str]):
+    if not name:
+        return None
+    # Enum classes never change, so (class, name) resolutions are memoized.
+    return _resolve_enum(enum_cls, str(name).upper())
+
 def _safe_set_style(obj, style_name: Optional[str]):
     if not style_name:
         return
@@ -532,6 +932,22 @@ def _underline_from_json(u: Any):
     # fallback to True for any non-empty truthy value
     return True
 
+# (font attribute, JSON key) pairs for the on/off font properties
+_BOOL_FONT_ATTRS = (
+    ("all_caps", "all_caps"),
+    ("small_caps", "small_caps"),
+    ("strike", "strike"),
+    ("double_strike", "double_strike"),
+    ("superscript", "superscript"),
+    ("subscript", "subscript"),
+)
+
+def _apply_bool_font_attrs(font, fobj: Dict[str, Any]):
+    for attr, key in _BOOL_FONT_ATTRS:
+        val = fobj.get(key)
+        if val is not None:
+            setattr(font, attr, bool(val))
+
 def _apply_run_formatting(run: _Run, run_obj: Dict[str, Any]):
     # style
     _safe_set_style(run, run_obj.get("style"))
@@ -569,16 +985,7 @@ def _apply_run_formatting(run: _Run, run_obj: Dict[str, Any]):
         if enum:
             font.highlight_color = enum
 
-    def set_bool(attr, key):
-        val = fobj.get(key)
-        if val is not None:
-            setattr(font, attr, bool(val))
-    set_bool("all_caps", "all_caps")
-    set_bool("small_caps", "small_caps")
-    set_bool("strike", "strike")
-    set_bool("double_strike", "double_strike")
-    set_bool("superscript", "superscript")
-    set_bool("subscript", "subscript")
+    _apply_bool_font_attrs(font, fobj)
 
 def _add_hyperlink_run(paragraph: Paragraph, text: str, url: Optional[str], anchor: Optional[str]) -> _Run:
     """
@@ -593,9 +1000,9 @@ def _add_hyperlink_run(paragraph: Paragraph, text: str, url: Optional[str], anch
 
     if url:
         r_id = part.relate_to(url, RT.HYPERLINK, is_external=True)
-        hyperlink.set(qn("r:id"), r_id)
+        hyperlink.set(_QN_R_ID, r_id)
     if anchor:
-        hyperlink.set(qn("w:anchor"), anchor)
+        hyperlink.set(_QN_W_ANCHOR, anchor)
 
     # Create the run element inside hyperlink
     new_run = OxmlElement("w:r")
@@ -603,7 +1010,7 @@ def _add_hyperlink_run(paragraph: Paragraph, text: str, url: Optional[str], anch
     new_run.append(new_rPr)
     t = OxmlElement("w:t")
     # preserve spaces
-    t.set(qn("xml:space"), "preserve")
+    t.set(_QN_XML_SPACE, "preserve")
     t.text = text or ""
     new_run.append(t)
 
@@ -668,7 +1075,7 @@ def _add_images_for_run(run: _Run, images: Optional[List[Dict[str, Any]]],
             else:
                 run.add_text("[Image]")
 
-def _write_paragraph(doc: Document,
+def _write_paragraph(doc: _Document,
                      block: Dict[str, Any],
                      image_resolver: Optional[Callable[[Dict[str, Any]], Optional[str]]],
                      resources_dir: Optional[str]) -> Optional[Paragraph]:
@@ -704,7 +1111,7 @@ def _write_paragraph(doc: Document,
 
     return p
 
-def _write_table(doc: Document,
+def _write_table(doc: _Document,
                  block: Dict[str, Any],
                  image_resolver: Optional[Callable[[Dict[str, Any]], Optional[str]]],
                  resources_dir: Optional[str]):
@@ -793,7 +1200,7 @@ def _write_table(doc: Document,
             for b in blocks:
                 write_block_into_cell(b)
 
-def _apply_core_properties(doc: Document, props: Dict[str, Any]):
+def _apply_core_properties(doc: _Document, props: Dict[str, Any]):
     if not isinstance(props, dict):
         return
     cp = doc.core_properties
@@ -813,43 +1220,49 @@ def _apply_core_properties(doc: Document, props: Dict[str, Any]):
     set_if_present("last_modified_by", "last_modified_by")
     # created/modified are handled by Word; setting strings may raise; skip.
 
-def _apply_section_settings(doc: Document, sections_info: List[Dict[str, Any]]):
+# Section length attributes and their keys in the "sections" JSON
+_PAGE_ATTRS = (
+    ("page_width", "page_width_pt"),
+    ("page_height", "page_height_pt"),
+    ("left_margin", "left_margin_pt"),
+    ("right_margin", "right_margin_pt"),
+    ("top_margin", "top_margin_pt"),
+    ("bottom_margin", "bottom_margin_pt"),
+    ("header_distance", "header_distance_pt"),
+    ("footer_distance", "footer_distance_pt"),
+)
+
+def _apply_section_settings(doc: _Document, sections_info: List[Dict[str, Any]]):
     if not sections_info:
         return
     # Apply only to the first section (we don't have block-to-section boundaries)
     s = doc.sections[0]
     info = sections_info[0] or {}
-    def set_len(attr, key):
+    for attr, key in _PAGE_ATTRS:
         v = info.get(key)
         if isinstance(v, (int, float)):
             try:
                 setattr(s, attr, _pt(v))
             except Exception:
                 pass
-    set_len("page_width", "page_width_pt")
-    set_len("page_height", "page_height_pt")
-    set_len("left_margin", "left_margin_pt")
-    set_len("right_margin", "right_margin_pt")
-    set_len("top_margin", "top_margin_pt")
-    set_len("bottom_margin", "bottom_margin_pt")
-    set_len("header_distance", "header_distance_pt")
-    set_len("footer_distance", "footer_distance_pt")
     # orientation enum might be present, but python-docx auto-sets with page sizes;
     # if present, we can try to set it.
     try:
-        from docx.enum.section import WD_ORIENTATION
         orient = _get_enum(WD_ORIENTATION, info.get("orientation"))
         if orient:
             s.orientation = orient
     except Exception:
         pass
 
+# Absolute output directories json2docx has already ensured exist
+_MKDIR_CACHE: Set[str] = set()
+
 def json2docx(
     json_source: Union[str, Dict[str, Any]],
     output_docx_path: str,
     resources_dir: Optional[str] = None,
     image_resolver: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None,
-) -> Document:
+) -> _Document:
     """
     Build a .docx file from a JSON object (or path) produced by docx2json
     — tolerant of JSON modified by an LLM.
@@ -892,8 +1305,18 @@ def json2docx(
             pass
 
     # Save
-    os.makedirs(os.path.dirname(os.path.abspath(output_docx_path)), exist_ok=True)
-    doc.save(output_docx_path)
+    out_dir = os.path.dirname(os.path.abspath(output_docx_path))
+    if out_dir not in _MKDIR_CACHE:
+        os.makedirs(out_dir, exist_ok=True)
+        _MKDIR_CACHE.add(out_dir)
+    try:
+        doc.save(output_docx_path)
+    except FileNotFoundError:
+        # The directory was removed after it was cached; recreate it once.
+        _MKDIR_CACHE.discard(out_dir)
+        os.makedirs(out_dir, exist_ok=True)
+        _MKDIR_CACHE.add(out_dir)
+        doc.save(output_docx_path)
     return doc
 
 # Example usage:
@@ -1,12 +1,79 @@
+import asyncio
+import functools
 import json
-from typing import Any, Dict, List
-from .llm_clients import get_llm_client
+import re
+from typing import Any, Callable, Dict, List, Optional
+from .json_utils import dumps_indented, loads
+from .llm_clients import LLMResponseTooLargeError, get_llm_client
+from .processor import apply_modifications
+
+@functools.lru_cache(maxsize=8)
+def _load_prompt(path: str) -> str:
+    # Prompt files are static; read each once per process
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+_ID_HINT = re.compile(r"doc-obj-\d+")
+# Single quotes only count at word boundaries, so apostrophes in contractions
+# and possessives ("don't", "title's") neither open nor close a hint.
+_TEXT_HINT = re.compile(r"(?<!\w)'([^\n]+?)'(?!\w)|\"([^\"\n]+)\"")
+
+
+def _project_for_query(user_query: str, json_data: Dict[str, Any],
+                       match_text: bool = False) -> Dict[str, Any]:
+    """
+    Narrows the document to the top-level blocks the query points at by object
+    id ("doc-obj-12"). With match_text, blocks containing quoted text from the
+    query (as whole words) also count; this is off by default because quoted
+    text is often the replacement value rather than a locator. Blocks are kept
+    whole so the LLM can still return complete objects. If nothing in the query
+    matches, json_data is returned unchanged.
+    """
+    blocks = json_data.get("blocks")
+    if not isinstance(blocks, list):
+        return json_data
+    ids = set(_ID_HINT.findall(user_query))
+    texts = [
+        re.compile(r"(?<!\w)" + re.escape(single or double) + r"(?!\w)")
+        for single, double in _TEXT_HINT.findall(user_query)
+        if not _ID_HINT.fullmatch(single or double)
+    ] if match_text else []
+    if not ids and not texts:
+        return json_data
+
+    matched = []
+    for block in blocks:
+        # ids and text of the block and everything nested in it
+        block_ids = set()
+        block_text = []
+        stack = [block]
+        while stack:
+            obj = stack.pop()
+            if type(obj) is dict:
+                if "id" in obj:
+                    block_ids.add(obj["id"])
+                if type(obj.get("text")) is str:
+                    block_text.append(obj["text"])
+                stack.extend(obj.values())
+            elif type(obj) is list:
+                stack.extend(obj)
+        # run texts are joined so quoted text split across runs still matches
+        joined = "".join(reversed(block_text))
+        if not ids.isdisjoint(block_ids) or any(t.search(joined) for t in texts):
+            matched.append(block)
+
+    if not matched:
+        return json_data
+    print(f"Sending {len(matched)} of {len(blocks)} blocks referenced by the query.")
+    return {**json_data, "blocks": matched}
 
 
 def create_document(
     user_query: str,
     provider: str,
-    prompt_path: str = "llm2doc/prompt/create_doc_prompt.txt"
+    prompt_path: str = "llm2doc/prompt/create_doc_prompt.txt",
+    on_chunk: Optional[Callable[[str], None]] = None
 ) -> Dict[str, Any]:
     """
     Sends a user query to an LLM to generate a new document in JSON format.
@@ -15,21 +82,22 @@ def create_document(
         user_query: The user's instruction for creating the document.
         provider: The LLM provider to use.
         prompt_path: The path to the system prompt for creation.
+        on_chunk: If given, the response is streamed and each piece of text is
+                  passed to it as it arrives (e.g. to show progress).
 
     Returns:
         A dictionary representing the complete JSON of the new document.
     """
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        system_prompt = f.read()
+    system_prompt = _load_prompt(prompt_path)
 
     print(f"--- Sending request to {provider.upper()} for document creation ---")
     
     try:
         llm_client = get_llm_client(provider)
         # For creation, we don't provide existing JSON data, only the query
-        created_json_str = llm_client.invoke(system_prompt, user_query, json_data=None)
+        created_json_str = llm_client.invoke(system_prompt, user_query, json_data=None, on_chunk=on_chunk)
         
-        created_json = json.loads(created_json_str)
+        created_json = loads(created_json_str)
         
         if not isinstance(created_json, dict):
             print("Warning: LLM did not return a valid JSON object for the document.")
@@ -37,6 +105,9 @@ def create_document(
             
         return created_json
 
+    except LLMResponseTooLargeError as e:
+        print(f"Error: {e}")
+        return {}
     except (ValueError, ImportError) as e:
         print(f"Error initializing LLM client: {e}")
         return {}
@@ -50,9 +121,13 @@ def create_document(
 
 def edit_document(
     user_query: str,
-    json_path: str,
+    json_path: Optional[str],
     provider: str,
-    prompt_path: str = "llm2doc/prompt/modify_doc_prompt.txt"
+    prompt_path: str = "llm2doc/prompt/modify_doc_prompt.txt",
+    json_data: Optional[Dict[str, Any]] = None,
+    project: bool = True,
+    on_chunk: Optional[Callable[[str], None]] = None,
+    project_by_text: bool = False
 ) -> List[Dict[str, Any]]:
     """
     Loads a document in JSON format, combines it with a user query and a prompt,
@@ -61,29 +136,43 @@ def edit_document(
     Args:
         user_query: The user's instruction for modifying the document.
         json_path: The path to the JSON file representing the document.
+                   Ignored when json_data is given.
         provider: The LLM provider to use (e.g., "chatgpt", "gemini").
         prompt_path: The path to the system prompt file.
+        json_data: The already-loaded document JSON (e.g. from docx2json),
+                   which saves writing it out and parsing it back.
+        project: If True, only the blocks the query refers to by id are sent
+                 when any can be found; otherwise the whole document.
+        on_chunk: If given, the response is streamed and each piece of text is
+                  passed to it as it arrives (e.g. to show progress).
+        project_by_text: If True (and project is set), blocks containing quoted
+                         text from the query are also treated as referenced.
 
     Returns:
         A list of dictionaries, where each dictionary is a modified object.
     """
     # Load the system prompt
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        system_prompt = f.read()
+    system_prompt = _load_prompt(prompt_path)
 
     # Load the document from the specified JSON file
-    with open(json_path, "r", encoding="utf-8") as f:
-        json_data = json.load(f)
+    if json_data is None:
+        if json_path is None:
+            raise ValueError("edit_document needs either json_path or json_data.")
+        with open(json_path, "r", encoding="utf-8") as f:
+            json_data = loads(f.read())
+
+    if project:
+        json_data = _project_for_query(user_query, json_data, project_by_text)
 
     print(f"--- Sending request to {provider.upper()} ---")
     
     try:
         # Get the client and invoke the LLM
         llm_client = get_llm_client(provider)
-        modified_json_str = llm_client.invoke(system_prompt, user_query, json_data)
+        modified_json_str = llm_client.invoke(system_prompt, user_query, json_data, on_chunk=on_chunk)
         
         # The LLM is expected to return a JSON array of modified objects
-        modified_objects = json.loads(modified_json_str)
+        modified_objects = loads(modified_json_str)
         
         if not isinstance(modified_objects, list):
             print("Warning: LLM did not return a JSON array. Wrapping in a list.")
@@ -91,6 +180,9 @@ def edit_document(
             
         return modified_objects
 
+    except LLMResponseTooLargeError as e:
+        print(f"Error: {e}")
+        return []
     except (ValueError, ImportError) as e:
         print(f"Error initializing LLM client: {e}")
         return []
@@ -101,6 +193,60 @@ def edit_document(
         print(f"An unexpected error occurred: {e}")
         return []
 
+async def edit_document_batch(
+    user_queries: List[str],
+    json_data: Dict[str, Any],
+    provider: str,
+    prompt_path: str = "llm2doc/prompt/modify_doc_prompt.txt",
+    project: bool = True,
+    project_by_text: bool = False
+) -> List[List[Dict[str, Any]]]:
+    """
+    Sends several independent edit queries about the same document to the LLM
+    concurrently, e.g. ``asyncio.run(edit_document_batch(queries, data, "chatgpt"))``.
+
+    Args:
+        user_queries: The user's instructions, each sent as its own request.
+        json_data: The document JSON (e.g. from docx2json).
+        provider: The LLM provider to use (e.g., "chatgpt", "gemini").
+        prompt_path: The path to the system prompt file.
+        project: As for edit_document, applied to each query separately.
+        project_by_text: As for edit_document.
+
+    Returns:
+        One list of modified objects per query, in query order. A query whose
+        request fails yields an empty list.
+    """
+    system_prompt = _load_prompt(prompt_path)
+
+    print(f"--- Sending {len(user_queries)} requests to {provider.upper()} ---")
+
+    try:
+        llm_client = get_llm_client(provider)
+    except (ValueError, ImportError) as e:
+        print(f"Error initializing LLM client: {e}")
+        return [[] for _ in user_queries]
+
+    async def edit_one(user_query: str) -> List[Dict[str, Any]]:
+        data = _project_for_query(user_query, json_data, project_by_text) if project else json_data
+        try:
+            modified_objects = loads(await llm_client.invoke_async(system_prompt, user_query, data))
+        except LLMResponseTooLargeError as e:
+            print(f"Error for query '{user_query}': {e}")
+            return []
+        except json.JSONDecodeError:
+            print(f"Error: The LLM did not return valid JSON for query: '{user_query}'")
+            return []
+        except Exception as e:
+            print(f"An unexpected error occurred for query '{user_query}': {e}")
+            return []
+        if not isinstance(modified_objects, list):
+            print("Warning: LLM did not return a JSON array. Wrapping in a list.")
+            return [modified_objects]
+        return modified_objects
+
+    return list(await asyncio.gather(*(edit_one(q) for q in user_queries)))
+
 if __name__ == "__main__":
     # --- Configuration ---
     # Choose your LLM provider here: "chatgpt", "gemini", "groq", "qwen", "deepseek"
@@ -112,42 +258,25 @@ if __name__ == "__main__":
     print(f"Provider: {LLM_PROVIDER.upper()}")
     print(f"Editing '{TEST_JSON_PATH}' with query: '{TEST_QUERY}'")
     
+    # Load the document once; it is both sent to the LLM and updated afterwards
+    with open(TEST_JSON_PATH, "r", encoding="utf-8") as f:
+        original_data = loads(f.read())
+
     # Run the edit function
-    modified_parts = edit_document(TEST_QUERY, TEST_JSON_PATH, LLM_PROVIDER)
+    modified_parts = edit_document(TEST_QUERY, None, LLM_PROVIDER, json_data=original_data)
     
     if modified_parts:
         print("\n--- LLM returned modified objects ---")
-        print(json.dumps(modified_parts, indent=2))
+        print(dumps_indented(modified_parts))
         
         # (Optional) To apply these changes back to the original file:
-        # 1. Load the original JSON
-        with open(TEST_JSON_PATH, "r", encoding="utf-8") as f:
-            original_data = json.load(f)
-        
-        # 2. Create a map of objects by ID for efficient lookup
-        id_map = {}
-        def build_id_map(obj):
-            if isinstance(obj, dict) and 'id' in obj:
-                id_map[obj['id']] = obj
-            if isinstance(obj, dict):
-                for value in obj.values():
-                    build_id_map(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    build_id_map(item)
-        
-        build_id_map(original_data)
-
-        # 3. Update the objects in the map
-        for modified_obj in modified_parts:
-            if 'id' in modified_obj and modified_obj['id'] in id_map:
-                id_map[modified_obj['id']].update(modified_obj)
-                print(f"Updated object with ID: {modified_obj['id']}")
+        # 1. Merge the modified objects into the original JSON by ID
+        original_data = apply_modifications(original_data, modified_parts)
 
-        # 4. Save the fully updated document
+        # 2. Save the fully updated document
         output_path = "output_modified.json"
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(original_data, f, indent=2)
+            f.write(dumps_indented(original_data))
         
         print(f"\nFully merged and modified JSON saved to '{output_path}'")
     else:
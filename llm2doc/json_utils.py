@@ -0,0 +1,55 @@
+"""
+JSON helpers shared by the editor, the LLM clients and the CLI.
+
+orjson is used when it is installed and the standard library otherwise;
+both produce the same documents.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+# Non-standard literals json.loads accepts and orjson does not
+_NON_FINITE = ("NaN", "Infinity", "-Infinity")
+
+
+def dumps_indented(obj: Any) -> str:
+    """Serialize obj as JSON indented by 2 spaces, non-ASCII kept as is."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; let json handle it
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def dumps_compact(obj: Any) -> str:
+    """Serialize obj as JSON without any whitespace, non-ASCII kept as is."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(s: str) -> Any:
+    """
+    Parse a JSON string. Invalid input raises json.JSONDecodeError
+    (orjson's error type subclasses it).
+    """
+    if orjson is None:
+        return json.loads(s)
+    try:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError as e:
+        # Only the literals json accepts but orjson rejects get a second parse;
+        # any other error is final, so malformed input is parsed once.
+        if not (s.startswith(_NON_FINITE, e.pos) or "infinity" in e.msg):
+            raise
+    return json.loads(s)
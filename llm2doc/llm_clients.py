@@ -14,21 +14,44 @@ You can install them using pip:
 pip install openai google-generativeai groq requests
 """
 
+import asyncio
+import functools
 import os
-import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from .json_utils import dumps_compact
+
+# Shared by every OpenAI-compatible client; imported once, needed only when one is built.
+try:
+    from openai import OpenAI
+except ImportError:
+    OpenAI = None  # type: ignore[assignment, misc]
 
 # It's good practice to use a library like `python-dotenv` to manage environment variables,
 # but for simplicity, we'll assume they are pre-loaded.
 # from dotenv import load_dotenv
 # load_dotenv()
 
+# Longest response accepted from a model. Anything longer is a runaway
+# generation and is rejected before the editor tries to parse it.
+MAX_LLM_RESPONSE_CHARS = 4_000_000
+
+class LLMResponseTooLargeError(ValueError):
+    """Raised when a model response exceeds MAX_LLM_RESPONSE_CHARS."""
+
+def _check_response_size(size: int):
+    if size > MAX_LLM_RESPONSE_CHARS:
+        raise LLMResponseTooLargeError(
+            f"LLM response exceeds {MAX_LLM_RESPONSE_CHARS} characters; rejected."
+        )
+
 class LLMClient(ABC):
     """Abstract base class for LLM API clients."""
 
     @abstractmethod
-    def invoke(self, system_prompt: str, user_prompt: str, json_data: Dict[str, Any] | None) -> str:
+    def invoke(self, system_prompt: str, user_prompt: str, json_data: Dict[str, Any] | None,
+               on_chunk: Optional[Callable[[str], None]] = None) -> str:
         """
         Sends a request to the LLM and returns the response content.
 
@@ -36,38 +59,98 @@ class LLMClient(ABC):
             system_prompt: The system-level instructions for the model.
             user_prompt: The user's specific query.
             json_data: The JSON data to be processed by the LLM, or None for creation.
+            on_chunk: If given, the response is streamed and each piece of text
+                      is passed to it as it arrives.
 
         Returns:
             The LLM's response as a string.
         """
         pass
 
-class ChatGPTClient(LLMClient):
-    """Client for OpenAI's ChatGPT API."""
+    async def invoke_async(self, system_prompt: str, user_prompt: str, json_data: Dict[str, Any] | None,
+                           on_chunk: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Awaitable variant of invoke, so several requests can be in flight at once.
 
-    def __init__(self, model: str = "gpt-4-turbo"):
-        from openai import OpenAI
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable not set.")
-        self.client = OpenAI(api_key=api_key)
-        self.model = model
+        The default runs the blocking invoke in a worker thread; the request is
+        network-bound, so threads overlap as well as a native async client would.
+        """
+        return await asyncio.to_thread(self.invoke, system_prompt, user_prompt, json_data, on_chunk)
+
+def _compose_user_prompt(user_prompt: str, json_data: Dict[str, Any] | None,
+                         system_prompt: Optional[str] = None) -> str:
+    # Single join, so the (possibly large) JSON text is copied only once
+    parts = [system_prompt, "\n\n", user_prompt] if system_prompt is not None else [user_prompt]
+    if json_data:
+        parts += ["\n\nHere is the JSON data:\n", dumps_compact(json_data)]
+    return "".join(parts)
+
+def _collect_stream(stream: Iterable[Any], on_chunk: Callable[[str], None]) -> str:
+    # Joins the text deltas of a streamed OpenAI-style chat completion,
+    # giving up as soon as the size cap is crossed
+    parts = []
+    size = 0
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            size += len(delta)
+            _check_response_size(size)
+            parts.append(delta)
+            on_chunk(delta)
+    return "".join(parts)
+
+class _OpenAICompatibleClient(LLMClient):
+    """
+    Shared client for chat-completions APIs that follow OpenAI's interface.
+    Subclasses only set where to connect and which model to use.
+    """
 
-    def invoke(self, system_prompt: str, user_prompt: str, json_data: Dict[str, Any] | None) -> str:
-        if json_data:
-            full_prompt = f"{user_prompt}\n\nHere is the JSON data:\n{json.dumps(json_data, indent=2)}"
-        else:
-            full_prompt = user_prompt
+    api_key_env: str = ""
+    base_url: Optional[str] = None
+    default_model: str = ""
+    # Passed through as response_format when set
+    response_format: Optional[Dict[str, str]] = None
 
+    def __init__(self, model: Optional[str] = None):
+        api_key = os.getenv(self.api_key_env)
+        if not api_key:
+            raise ValueError(f"{self.api_key_env} environment variable not set.")
+        self.client = self._create_client(api_key)
+        self.model = model or self.default_model
+
+    def _create_client(self, api_key: str) -> Any:
+        if OpenAI is None:
+            raise ImportError("The openai package is required: pip install openai")
+        return OpenAI(api_key=api_key, base_url=self.base_url)
+
+    def invoke(self, system_prompt: str, user_prompt: str, json_data: Dict[str, Any] | None,
+               on_chunk: Optional[Callable[[str], None]] = None) -> str:
+        full_prompt = _compose_user_prompt(user_prompt, json_data)
+
+        extra: Dict[str, Any] = {}
+        if self.response_format is not None:
+            extra["response_format"] = self.response_format
         response = self.client.chat.completions.create(
             model=self.model,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": full_prompt},
             ],
-            response_format={"type": "json_object"}
+            stream=on_chunk is not None,
+            **extra
         )
-        return response.choices[0].message.content or ""
+        if on_chunk is not None:
+            return _collect_stream(response, on_chunk)
+        content = response.choices[0].message.content or ""
+        _check_response_size(len(content))
+        return content
+
+class ChatGPTClient(_OpenAICompatibleClient):
+    """Client for OpenAI's ChatGPT API."""
+
+    api_key_env = "OPENAI_API_KEY"
+    default_model = "gpt-4-turbo"
+    response_format = {"type": "json_object"}
 
 class GeminiClient(LLMClient):
     """Client for Google's Gemini API."""
@@ -83,134 +166,65 @@ class GeminiClient(LLMClient):
             generation_config={"response_mime_type": "application/json"}
         )
 
-    def invoke(self, system_prompt: str, user_prompt: str, json_data: Dict[str, Any] | None) -> str:
-        if json_data:
-            full_prompt = f"{system_prompt}\n\n{user_prompt}\n\nHere is the JSON data:\n{json.dumps(json_data, indent=2)}"
-        else:
-            full_prompt = f"{system_prompt}\n\n{user_prompt}"
-
+    def invoke(self, system_prompt: str, user_prompt: str, json_data: Dict[str, Any] | None,
+               on_chunk: Optional[Callable[[str], None]] = None) -> str:
+        # Gemini gets the instructions inline rather than as a system message
+        full_prompt = _compose_user_prompt(user_prompt, json_data, system_prompt)
+
+        if on_chunk is not None:
+            parts = []
+            size = 0
+            for chunk in self.model.generate_content(full_prompt, stream=True):
+                size += len(chunk.text)
+                _check_response_size(size)
+                parts.append(chunk.text)
+                on_chunk(chunk.text)
+            return "".join(parts)
         response = self.model.generate_content(full_prompt)
+        _check_response_size(len(response.text))
         return response.text
 
-class GroqClient(LLMClient):
+class GroqClient(_OpenAICompatibleClient):
     """Client for Groq's API."""
 
-    def __init__(self, model: str = "llama3-70b-8192"):
-        from groq import Groq
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise ValueError("GROQ_API_KEY environment variable not set.")
-        self.client = Groq(api_key=api_key)
-        self.model = model
-
-    def invoke(self, system_prompt: str, user_prompt: str, json_data: Dict[str, Any] | None) -> str:
-        if json_data:
-            full_prompt = f"{user_prompt}\n\nHere is the JSON data:\n{json.dumps(json_data, indent=2)}"
-        else:
-            full_prompt = user_prompt
+    api_key_env = "GROQ_API_KEY"
+    default_model = "llama3-70b-8192"
+    response_format = {"type": "json_object"}
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": full_prompt},
-            ],
-            response_format={"type": "json_object"}
-        )
-        return response.choices[0].message.content or ""
+    def _create_client(self, api_key: str) -> Any:
+        from groq import Groq
+        return Groq(api_key=api_key)
 
-class QwenClient(LLMClient):
+class QwenClient(_OpenAICompatibleClient):
     """Client for Alibaba's Qwen (Tongyi Qwen) API."""
 
-    def __init__(self, model: str = "qwen-turbo"):
-        # Qwen uses an OpenAI-compatible client
-        from openai import OpenAI
-        api_key = os.getenv("DASHSCOPE_API_KEY") # Alibaba's key
-        if not api_key:
-            raise ValueError("DASHSCOPE_API_KEY environment variable not set.")
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url="https://dashscope.aliyuncs.com/compatible-mode/v1"
-        )
-        self.model = model
-
-    def invoke(self, system_prompt: str, user_prompt: str, json_data: Dict[str, Any] | None) -> str:
-        if json_data:
-            full_prompt = f"{user_prompt}\n\nHere is the JSON data:\n{json.dumps(json_data, indent=2)}"
-        else:
-            full_prompt = user_prompt
-        
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": full_prompt},
-            ]
-        )
-        return response.choices[0].message.content or ""
+    api_key_env = "DASHSCOPE_API_KEY"  # Alibaba's key
+    base_url = "https://dashscope.aliyuncs.com/compatible-mode/v1"
+    default_model = "qwen-turbo"
 
 
-class DoubaoClient(LLMClient):
+class DoubaoClient(_OpenAICompatibleClient):
     """Client for Doubao's API (Volcano Engine)."""
 
-    def __init__(self, model: str = "doubao-seed-1-6-250615"):
-        from openai import OpenAI
-        api_key = os.getenv("DOUBAO_API_KEY")
-        if not api_key:
-            raise ValueError("DOUBAO_API_KEY environment variable not set.")
-        self.client = OpenAI(
-            base_url="https://ark.cn-beijing.volces.com/api/v3",
-            api_key=api_key
-        )
-        self.model = model
+    api_key_env = "DOUBAO_API_KEY"
+    base_url = "https://ark.cn-beijing.volces.com/api/v3"
+    default_model = "doubao-seed-1-6-250615"
 
-    def invoke(self, system_prompt: str, user_prompt: str, json_data: Dict[str, Any] | None) -> str:
-        if json_data:
-            full_prompt = f"{user_prompt}\n\nHere is the JSON data:\n{json.dumps(json_data, indent=2)}"
-        else:
-            full_prompt = user_prompt
-        
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": full_prompt},
-            ]
-        )
-        return response.choices[0].message.content or ""
-
-class DeepseekClient(LLMClient):
+class DeepseekClient(_OpenAICompatibleClient):
     """Client for Deepseek's API."""
 
-    def __init__(self, model: str = "deepseek-chat"):
-        # Deepseek also uses an OpenAI-compatible client
-        from openai import OpenAI
-        api_key = os.getenv("DEEPSEEK_API_KEY")
-        if not api_key:
-            raise ValueError("DEEPSEEK_API_KEY environment variable not set.")
-        self.client = OpenAI(api_key=api_key, base_url="https://api.deepseek.com/v1")
-        self.model = model
-
-    def invoke(self, system_prompt: str, user_prompt: str, json_data: Dict[str, Any] | None) -> str:
-        if json_data:
-            full_prompt = f"{user_prompt}\n\nHere is the JSON data:\n{json.dumps(json_data, indent=2)}"
-        else:
-            full_prompt = user_prompt
-        
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": full_prompt},
-            ],
-            response_format={"type": "json_object"}
-        )
-        return response.choices[0].message.content or ""
+    api_key_env = "DEEPSEEK_API_KEY"
+    base_url = "https://api.deepseek.com/v1"
+    default_model = "deepseek-chat"
+    response_format = {"type": "json_object"}
 
 def get_llm_client(provider: str) -> LLMClient:
     """
     Factory function to get an LLM client based on the provider name.
 
+    Clients are created once per provider and reused, so repeated edits share
+    the SDK's HTTP connection pool instead of opening new connections.
+
     Args:
         provider: The name of the LLM provider. 
                   Supported: "chatgpt", "gemini", "groq", "qwen", "deepseek", "doubao".
@@ -218,7 +232,11 @@ def get_llm_client(provider: str) -> LLMClient:
     Returns:
         An instance of the corresponding LLMClient.
     """
-    provider = provider.lower()
+    return _create_llm_client(provider.lower())
+
+@functools.lru_cache(maxsize=None)
+def _create_llm_client(provider: str) -> LLMClient:
+    # Failed constructions (e.g. a missing API key) raise and are not cached.
     if provider == "chatgpt":
         return ChatGPTClient()
     elif provider == "gemini":
@@ -1,4 +1,30 @@
-from typing import Any, Dict, List
+from collections import deque
+from typing import Any, Dict, Iterable, List
+
+def _index_ids(roots: Iterable[Any], id_map: Dict[Any, Dict[str, Any]]):
+    # Walked with an explicit stack so deeply nested documents cannot hit the
+    # recursion limit; parsed JSON only holds plain dicts and lists.
+    stack = deque(roots)
+    while stack:
+        obj = stack.pop()
+        if type(obj) is dict:
+            if 'id' in obj:
+                id_map[obj['id']] = obj
+            stack.extend(obj.values())
+        elif type(obj) is list:
+            stack.extend(obj)
+
+def _unindex_ids(roots: Iterable[Any], id_map: Dict[Any, Dict[str, Any]]):
+    # Drops the entries for objects under roots that are about to be detached
+    stack = deque(roots)
+    while stack:
+        obj = stack.pop()
+        if type(obj) is dict:
+            if 'id' in obj and id_map.get(obj['id']) is obj:
+                del id_map[obj['id']]
+            stack.extend(obj.values())
+        elif type(obj) is list:
+            stack.extend(obj)
 
 def apply_modifications(original_data: Dict[str, Any], modified_parts: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -11,26 +37,39 @@ def apply_modifications(original_data: Dict[str, Any], modified_parts: List[Dict
     Returns:
         The fully updated JSON data.
     """
-    # Create a map of all objects by ID for efficient lookup
-    id_map = {}
-    def build_id_map(obj):
-        if isinstance(obj, dict) and 'id' in obj:
-            id_map[obj['id']] = obj
-        if isinstance(obj, dict):
-            for value in obj.values():
-                build_id_map(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                build_id_map(item)
-    
-    build_id_map(original_data)
+    if not modified_parts:
+        return original_data
+
+    # Create a map of all objects by ID for efficient lookup.
+    # docx2json output already carries one, so the tree is only walked otherwise;
+    # nothing needs it when no modification names an ID.
+    id_map = getattr(original_data, 'id_index', None)
+    if id_map is None:
+        id_map = {}
+        if any('id' in modified_obj for modified_obj in modified_parts):
+            _index_ids([original_data], id_map)
 
-    # Update the objects in the map based on the modifications
+    # Update the objects in the map based on the modifications. An LLM often
+    # repeats an object verbatim; repeats of the last update to an ID are skipped.
+    applied: Dict[Any, Dict[str, Any]] = {}
     for modified_obj in modified_parts:
         if 'id' in modified_obj and modified_obj['id'] in id_map:
+            obj_id = modified_obj['id']
+            if applied.get(obj_id) == modified_obj:
+                continue
+            target = id_map[obj_id]
+            # Values being replaced (e.g. old runs) leave the document, so their
+            # IDs must stop resolving; the objects brought in take their place.
+            _unindex_ids(
+                [target[key] for key, value in modified_obj.items()
+                 if key in target and target[key] is not value],
+                id_map,
+            )
             # Update the existing object with the new values
-            id_map[modified_obj['id']].update(modified_obj)
-            print(f"Applied update to object with ID: {modified_obj['id']}")
+            target.update(modified_obj)
+            _index_ids(modified_obj.values(), id_map)
+            applied[obj_id] = modified_obj
+            print(f"Applied update to object with ID: {obj_id}")
         else:
             print(f"Warning: Could not find object with ID: {modified_obj.get('id')}")
             
@@ -1,16 +1,17 @@
 import argparse
-import json
 import os
 import tempfile
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 import config
-from llm2doc.converter import docx2json, json2docx
+from llm2doc.converter import compact_json, docx2json, json2docx
 from llm2doc.editor import create_document, edit_document
+from llm2doc.json_utils import dumps_indented
 from llm2doc.processor import apply_modifications
 
 
-def create_docx(query: str, output_docx: str, provider: str = config.DEFAULT_PROVIDER):
+def create_docx(query: str, output_docx: str, provider: str = config.DEFAULT_PROVIDER,
+                on_chunk: Optional[Callable[[str], None]] = None):
     """
     Creates a new .docx file based on a user query using an LLM.
 
@@ -18,11 +19,15 @@ def create_docx(query: str, output_docx: str, provider: str = config.DEFAULT_PRO
         query: The natural language instruction for creating the document.
         output_docx: Path to save the new .docx file.
         provider: The LLM provider to use.
+        on_chunk: If given, the LLM response is streamed and each piece of text
+                  is passed to it as it arrives.
     """
     print("Starting creation workflow...")
     print("\nStep 1: Sending request to LLM for document creation...")
     try:
-        created_json = create_document(user_query=query, provider=provider)
+        created_json = create_document(user_query=query, provider=provider, on_chunk=on_chunk)
+        if on_chunk is not None:
+            print()  # end the streamed response's line
         if not created_json:
             print("LLM failed to generate a document. Exiting.")
             return
@@ -39,7 +44,8 @@ def create_docx(query: str, output_docx: str, provider: str = config.DEFAULT_PRO
         print(f"Error during JSON to DOCX conversion: {e}")
 
 
-def modify_docx(input_docx: str, query: str, output_docx: str, provider: str = config.DEFAULT_PROVIDER, keep_temp_file: bool = False):
+def modify_docx(input_docx: str, query: str, output_docx: str, provider: str = config.DEFAULT_PROVIDER, keep_temp_file: bool = False,
+                on_chunk: Optional[Callable[[str], None]] = None):
     """
     Modifies a .docx file based on a user query using an LLM.
 
@@ -48,35 +54,48 @@ def modify_docx(input_docx: str, query: str, output_docx: str, provider: str = c
         query: The natural language instruction for the edit.
         output_docx: Path to save the modified .docx file.
         provider: The LLM provider to use.
-        keep_temp_file: If True, the intermediate JSON file will not be deleted.
+        keep_temp_file: If True, the intermediate JSON is also written to a temporary file and kept.
+        on_chunk: If given, the LLM response is streamed and each piece of text
+                  is passed to it as it arrives.
     """
-    temp_json_file = tempfile.NamedTemporaryFile(
-        mode='w+', delete=False, suffix=".json", encoding="utf-8"
-    )
-    temp_json_path = temp_json_file.name
-    temp_json_file.close()
+    # The JSON is handed to the editor in memory; it only goes to disk when kept.
+    temp_json_path = None
+    if keep_temp_file:
+        # Only reserve the name here; docx2json writes the file in one go.
+        fd, temp_json_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
 
     try:
         print(f"Step 1: Converting '{input_docx}' to JSON...")
         try:
             full_json_data = docx2json(input_docx, json_path=temp_json_path, compact=False)
-            print(f"Successfully converted to '{temp_json_path}'")
+            if temp_json_path:
+                print(f"Successfully converted to '{temp_json_path}'")
+            else:
+                print("Successfully converted to JSON.")
         except Exception as e:
             print(f"Error during DOCX to JSON conversion: {e}")
             return
 
+        # The LLM gets a compact copy; ids match, so its edits apply to the full data.
         print("\nStep 2: Sending request to LLM for editing...")
         try:
             modified_parts = edit_document(
                 user_query=query,
-                json_path=temp_json_path,
-                provider=provider
+                json_path=None,
+                provider=provider,
+                json_data=compact_json(full_json_data),
+                on_chunk=on_chunk
             )
+            if on_chunk is not None:
+                print()  # end the streamed response's line
             if not modified_parts:
                 print("LLM returned no modifications. Exiting.")
                 return
             print("Successfully received modifications from LLM.")
-            print(json.dumps(modified_parts, indent=2))
+            # A streamed response has already been shown as it arrived
+            if on_chunk is None:
+                print(dumps_indented(modified_parts))
         except Exception as e:
             print(f"Error during LLM editing step: {e}")
             return
@@ -92,13 +111,14 @@ def modify_docx(input_docx: str, query: str, output_docx: str, provider: str = c
             print(f"Error during JSON to DOCX conversion: {e}")
 
     finally:
-        if not keep_temp_file and os.path.exists(temp_json_path):
-            os.remove(temp_json_path)
-            print(f"Cleaned up temporary file: '{temp_json_path}'")
-        elif keep_temp_file:
+        if temp_json_path:
             print(f"Temporary JSON file saved at: '{temp_json_path}'")
 
 
+def _print_chunk(text: str):
+    print(text, end="", flush=True)
+
+
 def main():
     """
     Main function to handle command-line operations for docx modification and creation.
@@ -113,14 +133,17 @@ def main():
     parser_edit.add_argument("--output-docx", required=True, help="Path to save the modified .docx file.")
     parser_edit.add_argument("--provider", default=config.DEFAULT_PROVIDER, help="The LLM provider to use.")
     parser_edit.add_argument("--keep-temp-file", action="store_true", help="Keep the intermediate JSON file.")
+    parser_edit.add_argument("--stream", action="store_true", help="Print the LLM response as it is generated.")
 
     # --- Create Command ---
     parser_create = subparsers.add_parser("create", help="Create a new .docx file from a query.")
     parser_create.add_argument("--query", required=True, help="The natural language instruction for creating the document.")
     parser_create.add_argument("--output-docx", required=True, help="Path to save the new .docx file.")
     parser_create.add_argument("--provider", default=config.DEFAULT_PROVIDER, help="The LLM provider to use.")
+    parser_create.add_argument("--stream", action="store_true", help="Print the LLM response as it is generated.")
 
     args = parser.parse_args()
+    on_chunk = _print_chunk if args.stream else None
 
     if args.command == "edit":
         modify_docx(
@@ -128,13 +151,15 @@ def main():
             query=args.query,
             output_docx=args.output_docx,
             provider=args.provider,
-            keep_temp_file=args.keep_temp_file
+            keep_temp_file=args.keep_temp_file,
+            on_chunk=on_chunk
         )
     elif args.command == "create":
         create_docx(
             query=args.query,
             output_docx=args.output_docx,
-            provider=args.provider
+            provider=args.provider,
+            on_chunk=on_chunk
         )
 
 
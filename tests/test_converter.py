@@ -0,0 +1,123 @@
+import json
+import os
+import re
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from docx import Document
+
+from llm2doc.converter import compact_json, docx2json
+
+_GENERATED_AT = re.compile(r'"generated_at": ?"[^"]*"')
+
+
+def _build_docx(path):
+    doc = Document()
+    doc.add_heading("Annual Report", level=1)
+    for i in range(6):
+        p = doc.add_paragraph(f"Paragraph {i} ")
+        p.add_run("bold").bold = True
+        p.add_run(" and ")
+        p.add_run("italic").italic = True
+        doc.add_paragraph(f"Item {i}", style="List Bullet")
+    table = doc.add_table(rows=3, cols=2)
+    for r, row in enumerate(table.rows):
+        for c, cell in enumerate(row.cells):
+            cell.text = f"r{r}c{c}"
+    table.cell(1, 1).add_table(rows=1, cols=2).cell(0, 0).text = "nested"
+    doc.add_paragraph("Closing paragraph")
+    doc.save(path)
+
+
+def _ids(data):
+    # id -> the first object carrying it, in document order
+    found = {}
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            if "id" in obj:
+                found.setdefault(obj["id"], obj)
+            stack.extend(reversed(list(obj.values())))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
+    return found
+
+
+class Docx2JsonTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.docx_path = os.path.join(cls.tmp.name, "sample.docx")
+        _build_docx(cls.docx_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def _write(self, name, **kwargs):
+        path = os.path.join(self.tmp.name, name)
+        docx2json(self.docx_path, json_path=path, **kwargs)
+        with open(path, "rb") as f:
+            return _GENERATED_AT.sub('"generated_at": ""', f.read().decode("utf-8"))
+
+    def test_streamed_file_matches_plain_file(self):
+        for compact in (False, True):
+            for indent in (2, None, 4, 0):
+                with self.subTest(compact=compact, indent=indent):
+                    plain = self._write("plain.json", indent=indent, compact=compact)
+                    streamed = self._write("stream.json", indent=indent, compact=compact, stream=True)
+                    self.assertEqual(streamed, plain)
+
+    def test_workers_match_serial_output(self):
+        for compact in (False, True):
+            with self.subTest(compact=compact):
+                serial = docx2json(self.docx_path, compact=compact)
+                parallel = docx2json(self.docx_path, compact=compact, workers=2)
+                del serial["meta"]["generated_at"], parallel["meta"]["generated_at"]
+                self.assertEqual(parallel, serial)
+
+    def test_id_index_maps_exactly_the_output_ids(self):
+        for workers in (None, 2):
+            with self.subTest(workers=workers):
+                data = docx2json(self.docx_path, workers=workers)
+                found = _ids(data)
+                self.assertTrue(found)
+                self.assertEqual(set(data.id_index), set(found))
+                for obj_id, obj in found.items():
+                    self.assertIs(data.id_index[obj_id], obj)
+
+    def test_streaming_returns_no_blocks(self):
+        data = docx2json(self.docx_path, json_path=os.path.join(self.tmp.name, "s.json"), stream=True)
+        self.assertEqual(data["blocks"], [])
+        with open(os.path.join(self.tmp.name, "s.json"), encoding="utf-8") as f:
+            self.assertTrue(json.load(f)["blocks"])
+
+    def test_id_index_survives_later_calls(self):
+        first = docx2json(self.docx_path)
+        docx2json(self.docx_path, compact=True)
+        for obj_id, obj in _ids(first).items():
+            self.assertIs(first.id_index[obj_id], obj)
+
+    def test_concurrent_calls_keep_their_own_ids(self):
+        serial = docx2json(self.docx_path)
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            results = list(ex.map(lambda _: docx2json(self.docx_path), range(8)))
+        for data in results:
+            found = _ids(data)
+            self.assertEqual(set(found), set(_ids(serial)))
+            self.assertEqual(set(data.id_index), set(found))
+            for obj_id, obj in found.items():
+                self.assertIs(data.id_index[obj_id], obj)
+
+    def test_compact_json_drops_containers_emptied_by_cleaning(self):
+        data = docx2json(self.docx_path)
+        text = json.dumps(compact_json(data))
+        self.assertNotIn("{}", text)
+        self.assertNotIn("[]", text)
+        self.assertEqual(set(_ids(compact_json(data))), set(_ids(data)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from llm2doc.editor import _TEXT_HINT, _project_for_query
+
+
+def _hints(query):
+    return [single or double for single, double in _TEXT_HINT.findall(query)]
+
+
+def _document():
+    return {"blocks": [
+        {"id": "doc-obj-1", "type": "paragraph", "runs": [{"id": "doc-obj-2", "type": "run", "text": "Heading"}]},
+        {"id": "doc-obj-3", "type": "paragraph", "runs": [{"id": "doc-obj-4", "type": "run", "text": "the tail"}]},
+    ]}
+
+
+class TextHintTest(unittest.TestCase):
+    def test_quoted_text(self):
+        self.assertEqual(_hints("Replace 'x' with \"y\""), ["x", "y"])
+
+    def test_possessive_does_not_open_a_hint(self):
+        self.assertEqual(_hints("Change the title's font in 'Heading'"), ["Heading"])
+
+    def test_contraction_does_not_open_a_hint(self):
+        self.assertEqual(_hints("Don't touch anything but 'tail'"), ["tail"])
+
+    def test_apostrophe_inside_a_hint(self):
+        self.assertEqual(_hints("Bold 'the author's note' only"), ["the author's note"])
+
+
+class ProjectionTest(unittest.TestCase):
+    def _project(self, query, data, match_text=False):
+        with redirect_stdout(io.StringIO()):
+            return _project_for_query(query, data, match_text)
+
+    def test_quoted_replacement_value_does_not_narrow_by_default(self):
+        data = {"blocks": [
+            {"id": "doc-obj-1", "type": "heading", "runs": [{"id": "doc-obj-2", "type": "run", "text": "Draft"}]},
+            {"id": "doc-obj-3", "type": "paragraph", "runs": [{"id": "doc-obj-4", "type": "run", "text": "See the Annual Report."}]},
+        ]}
+        projected = self._project("Change the main title to 'Annual Report' and make it bold.", data)
+        self.assertIs(projected, data)
+
+    def test_ids_narrow_by_default(self):
+        projected = self._project("Make doc-obj-4 italic", _document())
+        self.assertEqual([b["id"] for b in projected["blocks"]], ["doc-obj-3"])
+
+    def test_text_matching_ignores_apostrophes(self):
+        projected = self._project("Don't change the title's font, only 'tail'", _document(), match_text=True)
+        self.assertEqual([b["id"] for b in projected["blocks"]], ["doc-obj-3"])
+
+    def test_text_matching_uses_word_boundaries(self):
+        data = {"blocks": [{"id": "doc-obj-1", "type": "paragraph", "runs": [{"id": "doc-obj-2", "type": "run", "text": "Syntax"}]}]}
+        self.assertIs(self._project("Remove 'tax'", data, match_text=True), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Request-shape checks for the LLM clients against mocked SDKs.
+
+Expected values are those the original per-provider clients sent; the only
+intended differences are the compact JSON payload and the explicit
+stream=False.
+"""
+
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+from llm2doc import llm_clients
+from llm2doc.json_utils import dumps_compact
+
+JSON_OBJECT = {"type": "json_object"}
+
+# provider -> (API key variable, base_url, default model, response_format)
+OPENAI_STYLE = {
+    "chatgpt": ("OPENAI_API_KEY", None, "gpt-4-turbo", JSON_OBJECT),
+    "groq": ("GROQ_API_KEY", None, "llama3-70b-8192", JSON_OBJECT),
+    "qwen": ("DASHSCOPE_API_KEY", "https://dashscope.aliyuncs.com/compatible-mode/v1", "qwen-turbo", None),
+    "doubao": ("DOUBAO_API_KEY", "https://ark.cn-beijing.volces.com/api/v3", "doubao-seed-1-6-250615", None),
+    "deepseek": ("DEEPSEEK_API_KEY", "https://api.deepseek.com/v1", "deepseek-chat", JSON_OBJECT),
+}
+
+SYSTEM_PROMPT = "system"
+USER_PROMPT = "user"
+JSON_DATA = {"blocks": [{"id": "doc-obj-1", "type": "paragraph"}]}
+
+
+class _FakeSDK:
+    """Stands in for OpenAI / Groq: records constructor and create() kwargs."""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.init_kwargs = kwargs
+        self.create_kwargs = None
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self._create))
+        _FakeSDK.instances.append(self)
+
+    def _create(self, **kwargs):
+        self.create_kwargs = kwargs
+        message = types.SimpleNamespace(content="[]")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+class ClientRequestTest(unittest.TestCase):
+    def setUp(self):
+        _FakeSDK.instances = []
+        llm_clients._create_llm_client.cache_clear()
+        keys = {env: "test-key" for env, _, _, _ in OPENAI_STYLE.values()}
+        keys["GEMINI_API_KEY"] = "test-key"
+        patches = [
+            mock.patch.dict(os.environ, keys),
+            mock.patch.object(llm_clients, "OpenAI", _FakeSDK),
+            mock.patch.dict(sys.modules, {"groq": types.SimpleNamespace(Groq=_FakeSDK)}),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(llm_clients._create_llm_client.cache_clear)
+
+    def test_openai_style_requests_match_original_clients(self):
+        for provider, (_, base_url, model, response_format) in OPENAI_STYLE.items():
+            with self.subTest(provider=provider):
+                client = llm_clients.get_llm_client(provider)
+                self.assertEqual(client.invoke(SYSTEM_PROMPT, USER_PROMPT, JSON_DATA), "[]")
+                sdk = _FakeSDK.instances[-1]
+
+                self.assertEqual(sdk.init_kwargs["api_key"], "test-key")
+                self.assertEqual(sdk.init_kwargs.get("base_url"), base_url)
+
+                expected = {
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": f"{USER_PROMPT}\n\nHere is the JSON data:\n{dumps_compact(JSON_DATA)}"},
+                    ],
+                    "stream": False,
+                }
+                if response_format is not None:
+                    expected["response_format"] = response_format
+                self.assertEqual(sdk.create_kwargs, expected)
+
+    def test_gemini_request_matches_original_client(self):
+        model = mock.Mock()
+        model.generate_content.return_value = types.SimpleNamespace(text="[]")
+        genai = types.ModuleType("google.generativeai")
+        genai.configure = mock.Mock()
+        genai.GenerativeModel = mock.Mock(return_value=model)
+        google = types.ModuleType("google")
+        google.generativeai = genai
+        with mock.patch.dict(sys.modules, {"google": google, "google.generativeai": genai}):
+            client = llm_clients.get_llm_client("gemini")
+            self.assertEqual(client.invoke(SYSTEM_PROMPT, USER_PROMPT, JSON_DATA), "[]")
+
+        genai.configure.assert_called_once_with(api_key="test-key")
+        genai.GenerativeModel.assert_called_once_with(
+            "gemini-1.5-pro-latest",
+            generation_config={"response_mime_type": "application/json"},
+        )
+        model.generate_content.assert_called_once_with(
+            f"{SYSTEM_PROMPT}\n\n{USER_PROMPT}\n\nHere is the JSON data:\n{dumps_compact(JSON_DATA)}"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
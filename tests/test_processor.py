@@ -0,0 +1,58 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from llm2doc.processor import apply_modifications
+
+
+class _Indexed(dict):
+    """Mimics docx2json output, which carries its id index as an attribute."""
+
+
+def _document():
+    runs = [{"id": "doc-obj-1", "type": "run", "text": "a"},
+            {"id": "doc-obj-2", "type": "run", "text": "b"}]
+    return {"blocks": [{"id": "doc-obj-3", "type": "paragraph", "runs": runs}]}
+
+
+def _with_index(data):
+    indexed = _Indexed(data)
+    paragraph = data["blocks"][0]
+    indexed.id_index = {"doc-obj-3": paragraph, **{r["id"]: r for r in paragraph["runs"]}}
+    return indexed
+
+
+class ApplyModificationsTest(unittest.TestCase):
+    def _apply(self, data, parts):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            apply_modifications(data, parts)
+        return out.getvalue()
+
+    def test_replaced_objects_stop_resolving_across_calls(self):
+        for lookup, data in (("tree walk", _document()), ("id index", _with_index(_document()))):
+            with self.subTest(lookup=lookup):
+                new_run = {"id": "doc-obj-9", "type": "run", "text": "new"}
+                self._apply(data, [{"id": "doc-obj-3", "runs": [new_run]}])
+
+                log = self._apply(data, [{"id": "doc-obj-1", "text": "lost"}])
+                self.assertIn("Could not find object with ID: doc-obj-1", log)
+
+                self._apply(data, [{"id": "doc-obj-9", "text": "edited"}])
+                self.assertEqual(data["blocks"][0]["runs"], [{"id": "doc-obj-9", "type": "run", "text": "edited"}])
+
+    def test_replacement_reusing_an_id_stays_addressable(self):
+        data = _with_index(_document())
+        self._apply(data, [{"id": "doc-obj-3", "runs": [{"id": "doc-obj-1", "type": "run", "text": "c"}]}])
+        self._apply(data, [{"id": "doc-obj-1", "bold": True}])
+        self.assertEqual(data["blocks"][0]["runs"], [{"id": "doc-obj-1", "type": "run", "text": "c", "bold": True}])
+        self.assertNotIn("doc-obj-2", data.id_index)
+
+    def test_empty_modifications_leave_data_untouched(self):
+        data = _document()
+        self.assertIs(apply_modifications(data, []), data)
+        self.assertEqual(data, _document())
+
+
+if __name__ == "__main__":
+    unittest.main()